@@ -1,29 +1,40 @@
-from typing import ClassVar
-from dataclasses import dataclass, asdict
+import sys
+from typing import ClassVar, Iterable
+from dataclasses import dataclass
+from functools import cached_property
 
 
 @dataclass
 class InfoMessage:
     """Информационное сообщение о тренировке."""
+    __slots__ = ('training_type', 'duration', 'distance', 'speed',
+                 'calories')
+
     training_type: str  # Тип тренировки
     duration: float     # Продолжительность, часы
     distance: float     # Дистанция, киллометры
     speed: float        # Скорость, км/ч
     calories: float     # Затрачено энергии, килокалории
-    MESSAGE: str = ('Тип тренировки: {training_type}; '
-                    'Длительность: {duration:.3f} ч.; '
-                    'Дистанция: {distance:.3f} км; '
-                    'Ср. скорость: {speed:.3f} км/ч; '
-                    'Потрачено ккал: {calories:.3f}.')
+    MESSAGE: ClassVar[str] = ('Тип тренировки: {0}; '
+                              'Длительность: {1:.3f} ч.; '
+                              'Дистанция: {2:.3f} км; '
+                              'Ср. скорость: {3:.3f} км/ч; '
+                              'Потрачено ккал: {4:.3f}.')
 
     def get_message(self) -> str:
         """Отформатировать и вернуть готовое сообщение"""
-        return self.MESSAGE.format(**asdict(self))
+        return self.MESSAGE.format(self.training_type, self.duration,
+                                   self.distance, self.speed, self.calories)
 
 
 @dataclass
 class Training:
-    """Базовый класс тренировки."""
+    """Базовый класс тренировки.
+
+    Данные тренировки не должны меняться после создания: дистанция
+    и средняя скорость кэшируются при первом обращении.
+    """
+    TYPE_NAME: ClassVar[str] = 'Training'   # Название для сообщения
     LEN_STEP: ClassVar[float] = 0.65    # Шаг, метров
     M_IN_KM: ClassVar[float] = 1000     # Метров в км
     MIN_IN_HOUR: ClassVar[float] = 60   # Минут в часы
@@ -32,16 +43,34 @@ class Training:
     duration: float     # Продолжительность, час
     weight: float       # Вес
 
+    def __init_subclass__(cls, **kwargs) -> None:
+        """Запомнить название тренировки для сообщения."""
+        super().__init_subclass__(**kwargs)
+        cls.TYPE_NAME = cls.__name__
+
+    def __post_init__(self) -> None:
+        """Проверить длительность тренировки."""
+        if self.duration == 0:
+            raise ValueError("Длительность тренировки должна быть "
+                             "больше нуля")
+
+    @cached_property
+    def _distance(self) -> float:
+        """Дистанция в км, рассчитанная при первом обращении."""
+        return self.action * self.LEN_STEP / self.M_IN_KM
+
+    @cached_property
+    def _mean_speed(self) -> float:
+        """Средняя скорость, рассчитанная при первом обращении."""
+        return self._distance / self.duration
+
     def get_distance(self) -> float:
         """Получить дистанцию в км."""
-        return self.action * self.LEN_STEP / self.M_IN_KM
+        return self._distance
 
     def get_mean_speed(self) -> float:
         """Получить среднюю скорость движения."""
-        if self.duration == 0:
-            raise ValueError("Длительность тренировки должна быть "
-                             "больше нуля")
-        return self.get_distance() / self.duration
+        return self._mean_speed
 
     def get_spent_calories(self) -> float:
         """Получить количество затраченных калорий."""
@@ -51,7 +80,7 @@ class Training:
     def show_training_info(self) -> InfoMessage:
         """Вернуть информационное сообщение о выполненной тренировке."""
         return InfoMessage(
-            type(self).__name__,
+            self.TYPE_NAME,
             self.duration,
             self.get_distance(),
             self.get_mean_speed(),
@@ -66,6 +95,8 @@ class Running(Training):
     CALORIES_MEAN_SPEED_MULTIPLIER: ClassVar[float] = 18
     # Коэффициент формулы
     K1: ClassVar[float] = 1.79
+    # MIN_IN_HOUR / M_IN_KM одним множителем
+    K_TIME_WEIGHT: ClassVar[float] = Training.MIN_IN_HOUR / Training.M_IN_KM
 
     def get_spent_calories(self) -> float:
         """Расчитать колличество затраченных калорий при беге"""
@@ -74,8 +105,7 @@ class Running(Training):
                 self.CALORIES_MEAN_SPEED_MULTIPLIER
                 * self.get_mean_speed() + self.K1
             )
-            * self.weight / self.M_IN_KM * self.duration
-            * self.MIN_IN_HOUR)
+            * self.weight * self.duration * self.K_TIME_WEIGHT)
 
 
 @dataclass
@@ -85,6 +115,8 @@ class SportsWalking(Training):
     K_WALK2: ClassVar[float] = 0.029    # Коэффициент для формулы
     KM_H_M_S: ClassVar[float] = 0.278   # Коэфициент перевода км/ч в м/сек
     MM_TO_M: ClassVar[int] = 100        # Миллиметров в метре
+    # KM_H_M_S ** 2 * MM_TO_M * K_WALK2 одним множителем
+    K_SPEED_HEIGHT: ClassVar[float] = KM_H_M_S ** 2 * MM_TO_M * K_WALK2
 
     height: float  # Рост в мм
 
@@ -92,12 +124,11 @@ class SportsWalking(Training):
         """Расчитать колличество затраченных калорий при ходьбе"""
         return (
             (
-                self.K_WALK * self.weight
-                + ((self.get_mean_speed() * self.KM_H_M_S)
-                   ** 2 / (self.height / self.MM_TO_M))
-                * self.K_WALK2 * self.weight
+                self.K_WALK
+                + self.get_mean_speed() ** 2 / self.height
+                * self.K_SPEED_HEIGHT
             )
-            * (self.duration * self.MIN_IN_HOUR))
+            * self.weight * self.duration * self.MIN_IN_HOUR)
 
 
 @dataclass
@@ -111,7 +142,8 @@ class Swimming(Training):
     length_pool: float                  # Длина бассейна, метры
     count_pool: float                   # Количество пройденных дорожек
 
-    def get_mean_speed(self) -> float:
+    @cached_property
+    def _mean_speed(self) -> float:
         """Расчитать среднюю скорость вплавь"""
         return (self.count_pool * self.length_pool
                 / self.M_IN_KM / self.duration)
@@ -122,24 +154,38 @@ class Swimming(Training):
                 * self.K_SWM2 * self.weight * self.duration)
 
 
+TRAINING_TYPES = {
+    'SWM': Swimming,
+    'RUN': Running,
+    'WLK': SportsWalking
+}
+
+
 def read_package(workout_type: str, data: list) -> Training:
     """Прочитать данные полученные от датчиков."""
-    option_training = {
-        'SWM': Swimming,
-        'RUN': Running,
-        'WLK': SportsWalking
-    }
-    data_wrong = [x for x in data if x < 0]
-    if data_wrong:
+    if any(x < 0 for x in data):
+        data_wrong = [x for x in data if x < 0]
         raise ValueError(
             "Ошибка! Только положительные значения "
             f"{ {*data_wrong} }"
         )
-    if workout_type not in option_training:
+    training_type = TRAINING_TYPES.get(workout_type)
+    if training_type is None:
         raise ValueError(
             "Мы так не тренируемся! "
-            f"Можно только так: { {*option_training.keys()} }")
-    return option_training[workout_type](*data)
+            f"Можно только так: { {*TRAINING_TYPES.keys()} }")
+    return training_type(*data)
+
+
+def spent_calories(workout_type: str, data: list) -> float:
+    """Рассчитать затраченные калории, не формируя InfoMessage."""
+    return read_package(workout_type, data).get_spent_calories()
+
+
+def read_packages(packages: Iterable[tuple]) -> list:
+    """Прочитать пачку пакетов от датчиков за один вызов."""
+    return [read_package(workout_type, data)
+            for workout_type, data in packages]
 
 
 def main(training: Training) -> None:
@@ -148,6 +194,14 @@ def main(training: Training) -> None:
     print(info.get_message())
 
 
+def main_many(trainings: Iterable[Training]) -> None:
+    """Вывести сообщения о тренировках одной записью в консоль."""
+    sys.stdout.write(''.join(
+        training.show_training_info().get_message() + '\n'
+        for training in trainings
+    ))
+
+
 if __name__ == '__main__':
     packages = [
         ('SWM', [720, 1, 80, 25, 40]),
@@ -155,6 +209,4 @@ if __name__ == '__main__':
         ('WLK', [9000, 1, 75, 180]),
     ]
 
-    for workout_type, data in packages:
-        training = read_package(workout_type, data)
-        main(training)
+    main_many(read_packages(packages))
@@ -451,3 +451,105 @@ def test_main_output(input_data, expected):
     assert get_message_output == expected, (
         'Метод `main` должен печатать результат в консоль.\n'
     )
+
+
+def test_read_packages():
+    assert hasattr(homework, 'read_packages'), (
+        'Создайте функцию для обработки пачки пакетов - `read_packages`'
+    )
+    result = homework.read_packages([
+        ('SWM', [720, 1, 80, 25, 40]),
+        ('RUN', [15000, 1, 75]),
+        ('WLK', [9000, 1, 75, 180]),
+    ])
+    assert [r.__class__.__name__ for r in result] == [
+        'Swimming', 'Running', 'SportsWalking'
+    ], (
+        'Функция `read_packages` должна возвращать тренировки '
+        'в порядке поступления пакетов.'
+    )
+
+
+@pytest.mark.parametrize('input_data', [
+    ('SWM', [720, 0, 80, 25, 40]),
+    ('RUN', [15000, 0, 75]),
+    ('WLK', [9000, 0, 75, 180]),
+])
+def test_read_package_zero_duration(input_data):
+    with pytest.raises(ValueError):
+        homework.read_package(*input_data)
+
+
+@pytest.mark.parametrize('input_data', [
+    ('SWM', [720, 1, -80, 25, 40]),
+    ('RUN', [-15000, 1, 75]),
+    ('WLK', [9000, 1, 75, -180]),
+])
+def test_read_package_negative_values(input_data):
+    with pytest.raises(ValueError):
+        homework.read_package(*input_data)
+
+
+def test_main_many_output():
+    trainings = homework.read_packages([
+        ('SWM', [720, 1, 80, 25, 40]),
+        ('WLK', [9000, 1, 75, 180]),
+    ])
+    with Capturing() as get_message_output:
+        homework.main_many(trainings)
+    assert get_message_output == [
+        'Тип тренировки: Swimming; '
+        'Длительность: 1.000 ч.; '
+        'Дистанция: 0.994 км; '
+        'Ср. скорость: 1.000 км/ч; '
+        'Потрачено ккал: 336.000.',
+        'Тип тренировки: SportsWalking; '
+        'Длительность: 1.000 ч.; '
+        'Дистанция: 5.850 км; '
+        'Ср. скорость: 5.850 км/ч; '
+        'Потрачено ккал: 349.252.',
+    ], (
+        'Функция `main_many` должна печатать сообщение '
+        'о каждой тренировке на отдельной строке.\n'
+    )
+
+
+@pytest.mark.parametrize('input_data, expected', [
+    (('SWM', [720, 1, 80, 25, 40]), 336.0),
+    (('RUN', [9000, 1, 75]), 481.905),
+    (('WLK', [9000, 1, 75, 180]), 349.252),
+])
+def test_spent_calories(input_data, expected):
+    result = round(homework.spent_calories(*input_data), 3)
+    assert result == expected, (
+        'Функция `spent_calories` должна возвращать калории '
+        'тренировки по коду и данным пакета.'
+    )
+
+
+@pytest.mark.parametrize('input_data, field, value, expected', [
+    (('RUN', [15000, 1, 75]), 'duration', 2, (9.75, 4.875)),
+    (('RUN', [15000, 1, 75]), 'action', 9000, (5.85, 5.85)),
+    (('SWM', [720, 1, 80, 25, 40]), 'count_pool', 20, (0.9936, 0.5)),
+])
+def test_show_training_info_computed_on_first_use(input_data, field, value,
+                                                  expected):
+    training = homework.read_package(*input_data)
+    setattr(training, field, value)
+    result = training.show_training_info()
+    assert (round(result.distance, 4), result.speed) == expected, (
+        'Дистанция и средняя скорость должны рассчитываться '
+        'по данным тренировки при первом обращении.'
+    )
+    assert result.calories == training.get_spent_calories()
+
+
+def test_show_training_info_subclass_name():
+    class Trail(homework.Running):
+        pass
+
+    result = Trail(15000, 1, 75).show_training_info()
+    assert result.training_type == 'Trail', (
+        'Метод `show_training_info` должен указывать название '
+        'класса тренировки, в том числе для наследников.'
+    )